@@ -11,6 +11,8 @@ sys.path.insert(0, '/Users/mustafaahmed/Documents/medical-research-agent')
 from tools.fda_api import FDADatabase, check_fda_510k, get_fda_company_profile
 from tools.web_scraper import CompanyScraper, scrape_company_website
 from tools.competitor_mapping import map_competitors, build_market_matrix
+from tools.search import DuckDuckGoScraper, BingHTMLScraper
+from bs4 import BeautifulSoup
 
 def test_fda_api():
     """Test FDA openFDA API integration."""
@@ -84,6 +86,38 @@ def test_competitor_mapping():
 
     return True
 
+def test_search_parsing():
+    """Test that search result strainers keep multi-class result markup (offline)."""
+    print("\n" + "="*60)
+    print("🔎 TESTING SEARCH RESULT PARSING")
+    print("="*60)
+
+    ddg_html = """
+    <div class="result results_links results_links_deep web-result ">
+      <a class="result__a" href="https://example.com">Example</a>
+      <a class="result__snippet">Snippet</a>
+    </div>
+    <div class="result">
+      <a class="result__a" href="https://example.org">Plain</a>
+    </div>
+    <div class="results">Not a result card</div>
+    """
+    bing_html = """
+    <li class="b_algo b_vtl_deeplinks"><a href="https://example.com">Example</a></li>
+    <li class="b_algo"><a href="https://example.org">Plain</a></li>
+    <li class="b_ad">Ad</li>
+    """
+
+    ddg = BeautifulSoup(ddg_html, "lxml", parse_only=DuckDuckGoScraper.RESULT_STRAINER)
+    bing = BeautifulSoup(bing_html, "lxml", parse_only=BingHTMLScraper.RESULT_STRAINER)
+    ddg_count = len(ddg.find_all("div", class_="result"))
+    bing_count = len(bing.find_all("li", class_="b_algo"))
+
+    print(f"   DuckDuckGo cards kept: {ddg_count} (expected 2)")
+    print(f"   Bing items kept: {bing_count} (expected 2)")
+
+    return ddg_count == 2 and bing_count == 2
+
 def main():
     print("\n" + "="*60)
     print("🧪 MEDICAL RESEARCH AGENT - COMPONENT TESTS")
@@ -113,6 +147,13 @@ def main():
         print(f"   ❌ Competitor Mapping Error: {e}")
         results["Competitor Mapping"] = False
 
+    # Test Search Parsing
+    try:
+        results["Search Parsing"] = test_search_parsing()
+    except Exception as e:
+        print(f"   ❌ Search Parsing Error: {e}")
+        results["Search Parsing"] = False
+
     # Summary
     print("\n" + "="*60)
     print("📋 TEST SUMMARY")
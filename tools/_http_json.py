@@ -0,0 +1,32 @@
+"""
+JSON helpers for API responses and tool results.
+Parses raw bytes with orjson when it is installed, otherwise uses requests' decoder.
+"""
+
+import json
+from typing import Any
+
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, skipping the bytes-to-str copy when possible."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # e.g. non-UTF-8 bodies, which requests can still decode
+            pass
+    return response.json()
+
+
+def to_json(result: Any, pretty: bool = False) -> str:
+    """Serialize a tool result; compact by default to keep LLM input small."""
+    if pretty:
+        return json.dumps(result, indent=2, default=str)
+    return json.dumps(result, separators=(",", ":"), default=str)
@@ -0,0 +1,75 @@
+"""
+On-disk cache of fetched page bodies.
+Stores only the bytes a scraper actually read, so download size caps still hold.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import NamedTuple, Optional
+
+
+class CachedPage(NamedTuple):
+    """A stored page body and what is needed to decode it."""
+    url: str
+    content: bytes
+    encoding: str
+    fetched_at: float
+
+
+class PageCache:
+    """Thread-safe SQLite store of page bodies keyed by request URL."""
+
+    # Expired entries are kept this many TTLs to serve when a site is down
+    STALE_TTLS = 4
+
+    def __init__(self, path: str, ttl: float):
+        """
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays fresh
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "request_url TEXT PRIMARY KEY, url TEXT, content BLOB, encoding TEXT, fetched_at REAL)"
+            )
+            self._conn.execute(
+                "DELETE FROM pages WHERE fetched_at < ?",
+                (time.time() - self.STALE_TTLS * ttl,)
+            )
+
+    def get(self, request_url: str, allow_stale: bool = False) -> Optional[CachedPage]:
+        """
+        Cached page for a URL.
+
+        Args:
+            request_url: URL the page was requested with
+            allow_stale: Also return entries older than the TTL
+
+        Returns:
+            The cached page, or None if missing (or expired, unless allow_stale)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, content, encoding, fetched_at FROM pages WHERE request_url = ?",
+                (request_url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        page = CachedPage(*row)
+        if not allow_stale and time.time() - page.fetched_at > self.ttl:
+            return None
+        return page
+
+    def set(self, request_url: str, url: str, content: bytes, encoding: str) -> None:
+        """Store a page body, replacing any earlier entry for the URL."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (request_url, url, content, encoding, time.time())
+            )
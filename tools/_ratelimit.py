@@ -0,0 +1,92 @@
+"""
+Token-bucket rate limiting for external APIs.
+Keeps bursts under the published limits instead of getting HTTP 429s.
+"""
+
+import threading
+import time
+from typing import Callable
+
+import requests
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate up to a burst capacity."""
+
+    def __init__(self, rate_per_sec: float, capacity: int):
+        """
+        Args:
+            rate_per_sec: Tokens added per second (sustained request rate)
+            capacity: Max tokens held (largest allowed burst)
+        """
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate_per_sec
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate_per_sec
+            time.sleep(wait)
+
+
+# openFDA: 240 requests/minute
+FDA_BUCKET = TokenBucket(240 / 60, 20)
+
+# Notion: average of 3 requests/second
+NOTION_BUCKET = TokenBucket(3, 3)
+
+# HTML search engines: no published limit, so pace each host conservatively
+HOST_BUCKETS = {
+    "html.duckduckgo.com": TokenBucket(1, 2),
+    "www.bing.com": TokenBucket(1, 2),
+}
+
+
+def send_with_retry(
+    bucket: TokenBucket,
+    send: Callable[[], requests.Response],
+    max_tries: int = 3
+) -> requests.Response:
+    """
+    Send a request through a rate limiter, retrying on HTTP 429.
+
+    Args:
+        bucket: Limiter to acquire a token from before each attempt
+        send: Zero-argument callable that performs the request
+        max_tries: Attempts before giving up and returning the 429 response
+
+    Returns:
+        The first non-429 response, or the last response received
+    """
+    for attempt in range(max_tries):
+        bucket.acquire()
+        response = send()
+        if response.status_code != 429 or attempt == max_tries - 1:
+            return response
+
+        delay = _retry_after(response, default=2 ** attempt)
+        response.close()
+        time.sleep(delay)
+
+
+def _retry_after(response: requests.Response, default: float) -> float:
+    """Seconds to wait from the Retry-After header, or default if absent."""
+    try:
+        return max(float(response.headers["Retry-After"]), 0)
+    except (KeyError, TypeError, ValueError):
+        return default
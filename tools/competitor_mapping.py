@@ -4,12 +4,33 @@ Identifies competitors, market segments, and positioning for medical device comp
 """
 
 import json
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import requests
 
 
+# Positioning opportunities and Gulf notes currently apply to every specialty
+_OPPORTUNITIES = (
+    "Price-competitive alternative to major brands",
+    "Specialized features for emerging markets",
+    "Bundled service and support packages",
+    "Local regulatory expertise and support",
+    "Training and education programs",
+    "Flexible financing options"
+)
+
+_GULF_NOTES = (
+    "Saudi Vision 2030 driving healthcare investment",
+    "UAE positioning as regional medical tourism hub",
+    "MOH and DOH tender requirements vary by emirate/country",
+    "Arabic language support often required for public sector",
+    "Local partner registration typically required for tender participation",
+    "Growing demand for connected/smart medical devices"
+)
+
+
 @dataclass
 class CompetitorProfile:
     """Structured competitor information."""
@@ -44,6 +65,12 @@ class CompetitorAnalyzer:
         "laboratory": ["Roche", "Abbott", "Siemens Healthineers", "Beckman Coulter", "Sysmex"]
     }
 
+    # MAJOR_PLAYERS with lowercased names precomputed for self-match checks
+    _PLAYERS_LOWER = {
+        key: (players, tuple(p.lower() for p in players))
+        for key, players in MAJOR_PLAYERS.items()
+    }
+
     # Company size indicators
     SIZE_INDICATORS = {
         "enterprise": ["Fortune 500", "global leader", "billion revenue", "worldwide presence", "multinational"],
@@ -52,6 +79,20 @@ class CompetitorAnalyzer:
         "startup": ["innovative", "disrupting", "founded in 20", "series", "venture"]
     }
 
+    # Market segments by specialty keyword
+    SEGMENTS = {
+        "patient monitoring": ["Bedside monitors", "Central stations", "Wearables", "Telemetry"],
+        "ventilators": ["ICU ventilators", "Transport ventilators", "Home care", "Neonatal"],
+        "imaging": ["CT", "MRI", "X-ray", "Mobile imaging"],
+        "ultrasound": ["General imaging", "Cardiac", "Point-of-care", "OB/GYN"],
+        "surgical": ["Instruments", "Electrosurgery", "Navigation", "Robotics"]
+    }
+
+    # Words of each segment keyword, built once at import; all must be present
+    _SEGMENT_WORDS = [(frozenset(key.split()), segs) for key, segs in SEGMENTS.items()]
+    # Words of a lowercased specialty, ignoring punctuation ("Imaging/Radiology")
+    _WORD_RE = re.compile(r"[a-z]+")
+
     def __init__(self, search_func=None):
         """
         Initialize analyzer.
@@ -73,13 +114,17 @@ class CompetitorAnalyzer:
         Returns competitive landscape analysis.
         """
         specialty_lower = specialty.lower()
+        company_lower = company_name.lower()
 
         # Find relevant major players
         major_competitors = []
-        for key, players in self.MAJOR_PLAYERS.items():
+        for key, (players, players_lower) in self._PLAYERS_LOWER.items():
             if key in specialty_lower or specialty_lower in key:
-                for player in players:
-                    if player.lower() != company_name.lower():
+                if company_lower not in players_lower:
+                    major_competitors.extend(players)
+                    continue
+                for player, player_lower in zip(players, players_lower):
+                    if player_lower != company_lower:
                         major_competitors.append(player)
 
         # Remove duplicates
@@ -178,50 +223,55 @@ class CompetitorAnalyzer:
         }
 
         # Score each company
-        scored = []
-        for company in companies:
-            score = {
-                "name": company.get("name"),
-                "cert_score": len(company.get("certifications", [])),
-                "gulf_score": 0 if company.get("gulf_presence") in ["Has Distributor", "Direct Office"] else 1,
-                "product_score": len(company.get("products", [])),
-                "total_score": 0
-            }
-            score["total_score"] = score["cert_score"] + score["gulf_score"] * 2 + min(score["product_score"], 5)
-            scored.append(score)
+        cols = self._score_soa(companies)
+        names = cols["name"]
 
         # Sort by different criteria
-        matrix["rankings"]["by_certifications"] = [
-            s["name"] for s in sorted(scored, key=lambda x: x["cert_score"], reverse=True)
-        ]
-        matrix["rankings"]["by_gulf_opportunity"] = [
-            s["name"] for s in sorted(scored, key=lambda x: x["gulf_score"], reverse=True)
-        ]
-        matrix["rankings"]["by_product_breadth"] = [
-            s["name"] for s in sorted(scored, key=lambda x: x["product_score"], reverse=True)
-        ]
+        matrix["rankings"]["by_certifications"] = [names[i] for i in self._rank(cols["cert"])]
+        matrix["rankings"]["by_gulf_opportunity"] = [names[i] for i in self._rank(cols["gulf"])]
+        matrix["rankings"]["by_product_breadth"] = [names[i] for i in self._rank(cols["prod"])]
 
         # Build matrix rows
-        for s in sorted(scored, key=lambda x: x["total_score"], reverse=True):
+        by_total = self._rank(cols["total"])
+        for i in by_total:
             matrix["matrix"].append({
-                "company": s["name"],
-                "certifications": s["cert_score"],
-                "gulf_opportunity": "High" if s["gulf_score"] == 1 else "Low",
-                "product_breadth": s["product_score"],
-                "overall_score": s["total_score"]
+                "company": names[i],
+                "certifications": cols["cert"][i],
+                "gulf_opportunity": "High" if cols["gulf"][i] == 1 else "Low",
+                "product_breadth": cols["prod"][i],
+                "overall_score": cols["total"][i]
             })
 
         # Top recommendations
-        top_companies = sorted(scored, key=lambda x: x["total_score"], reverse=True)[:3]
-        for company in top_companies:
+        for i in by_total[:3]:
             matrix["recommendations"].append({
-                "company": company["name"],
-                "rationale": f"Score: {company['total_score']} - " +
-                           ("No Gulf presence" if company["gulf_score"] == 1 else "Established market")
+                "company": names[i],
+                "rationale": f"Score: {cols['total'][i]} - " +
+                           ("No Gulf presence" if cols["gulf"][i] == 1 else "Established market")
             })
 
         return matrix
 
+    def _score_soa(self, companies: List[Dict]) -> Dict[str, List]:
+        """
+        Score companies into parallel columns (one list per field).
+
+        Returns dict with "name", "cert", "gulf", "prod" and "total" columns,
+        where index i in every column refers to companies[i].
+        """
+        names = [c.get("name") for c in companies]
+        cert = [len(c.get("certifications", [])) for c in companies]
+        gulf = [0 if c.get("gulf_presence") in ("Has Distributor", "Direct Office") else 1 for c in companies]
+        prod = [len(c.get("products", [])) for c in companies]
+        total = [c + g * 2 + min(p, 5) for c, g, p in zip(cert, gulf, prod)]
+
+        return {"name": names, "cert": cert, "gulf": gulf, "prod": prod, "total": total}
+
+    @staticmethod
+    def _rank(column: List[int]) -> List[int]:
+        """Indices of column ordered highest first, ties kept in input order."""
+        return sorted(range(len(column)), key=column.__getitem__, reverse=True)
+
     def _assess_intensity(self, num_competitors: int) -> str:
         """Assess competitive intensity based on number of major players."""
         if num_competitors >= 6:
@@ -233,41 +283,26 @@ class CompetitorAnalyzer:
 
     def _identify_segments(self, specialty: str) -> List[str]:
         """Identify market segments within a specialty."""
-        segments = {
-            "patient monitoring": ["Bedside monitors", "Central stations", "Wearables", "Telemetry"],
-            "ventilators": ["ICU ventilators", "Transport ventilators", "Home care", "Neonatal"],
-            "imaging": ["CT", "MRI", "X-ray", "Mobile imaging"],
-            "ultrasound": ["General imaging", "Cardiac", "Point-of-care", "OB/GYN"],
-            "surgical": ["Instruments", "Electrosurgery", "Navigation", "Robotics"]
-        }
+        specialty_lower = specialty.lower()
+        words = set(self._WORD_RE.findall(specialty_lower))
+        for key_words, segs in self._SEGMENT_WORDS:
+            if key_words <= words:
+                return segs
 
-        for key, segs in segments.items():
-            if key in specialty.lower():
+        # Keywords inside compound words, e.g. "neurosurgical"
+        for key, segs in self.SEGMENTS.items():
+            if key in specialty_lower:
                 return segs
 
         return ["Core products", "Accessories", "Software/Services"]
 
-    def _find_opportunities(self, specialty: str) -> List[str]:
+    def _find_opportunities(self, specialty: str) -> Tuple[str, ...]:
         """Identify positioning opportunities in the market."""
-        return [
-            "Price-competitive alternative to major brands",
-            "Specialized features for emerging markets",
-            "Bundled service and support packages",
-            "Local regulatory expertise and support",
-            "Training and education programs",
-            "Flexible financing options"
-        ]
-
-    def _gulf_market_notes(self, specialty: str) -> List[str]:
+        return _OPPORTUNITIES
+
+    def _gulf_market_notes(self, specialty: str) -> Tuple[str, ...]:
         """Provide Gulf-specific market notes."""
-        return [
-            "Saudi Vision 2030 driving healthcare investment",
-            "UAE positioning as regional medical tourism hub",
-            "MOH and DOH tender requirements vary by emirate/country",
-            "Arabic language support often required for public sector",
-            "Local partner registration typically required for tender participation",
-            "Growing demand for connected/smart medical devices"
-        ]
+        return _GULF_NOTES
 
 
 def map_competitors(company_name: str, specialty: str, products: List[str] = None) -> str:
@@ -5,16 +5,57 @@ Finds business contact emails for outreach.
 
 import requests
 import json
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
 from urllib.parse import urlparse
 import os
 
+from ._cache import TTLCache
+from ._http_json import parse_json
+
+
+class EmailRecord(NamedTuple):
+    """Email found by Hunter.io domain search. Use _asdict() for JSON output."""
+    email: Optional[str]
+    type: Optional[str]  # personal, generic
+    confidence: Optional[int]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    position: Optional[str]
+    department: Optional[str]
+    linkedin: Optional[str]
+
+
+def _request(method: str, url: str, **kwargs) -> Dict:
+    """
+    Send an API request without downloading the body of error responses.
+
+    Hunter and Apollo attach JSON bodies to 401/429 errors, which are common
+    at free-tier limits; streaming lets us check the status first.
+
+    Returns:
+        {"success": True, "data": parsed JSON} or {"success": False, "error": message}
+    """
+    response = requests.request(method, url, stream=True, timeout=15, **kwargs)
+    try:
+        if response.status_code == 401:
+            return {"success": False, "error": "Invalid API key"}
+        if response.status_code == 429:
+            return {"success": False, "error": "Rate limit exceeded"}
+        if response.status_code >= 400:
+            return {"success": False, "error": f"HTTP {response.status_code}: {response.reason}"}
+        return {"success": True, "data": parse_json(response)}
+    finally:
+        response.close()
+
 
 class HunterIO:
     """Hunter.io API client for email discovery."""
 
     BASE_URL = "https://api.hunter.io/v2"
 
+    _cache = TTLCache(maxsize=512, ttl=3600)
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Hunter.io client.
@@ -34,8 +75,13 @@ class HunterIO:
             limit: Max emails to return
 
         Returns:
-            Dictionary with emails and patterns found
+            Dictionary with emails (as EmailRecord) and patterns found
         """
+        cache_key = ("domain_search", domain, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         params = {
             "domain": domain,
             "api_key": self.api_key,
@@ -43,28 +89,25 @@ class HunterIO:
         }
 
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/domain-search",
-                params=params,
-                timeout=15
-            )
-            response.raise_for_status()
-            data = response.json().get("data", {})
+            response = _request("GET", f"{self.BASE_URL}/domain-search", params=params)
+            if not response["success"]:
+                return response
+            data = response["data"].get("data", {})
 
             emails = []
             for email_data in data.get("emails", []):
-                emails.append({
-                    "email": email_data.get("value"),
-                    "type": email_data.get("type"),  # personal, generic
-                    "confidence": email_data.get("confidence"),
-                    "first_name": email_data.get("first_name"),
-                    "last_name": email_data.get("last_name"),
-                    "position": email_data.get("position"),
-                    "department": email_data.get("department"),
-                    "linkedin": email_data.get("linkedin")
-                })
-
-            return {
+                emails.append(EmailRecord(
+                    email=email_data.get("value"),
+                    type=email_data.get("type"),
+                    confidence=email_data.get("confidence"),
+                    first_name=email_data.get("first_name"),
+                    last_name=email_data.get("last_name"),
+                    position=email_data.get("position"),
+                    department=email_data.get("department"),
+                    linkedin=email_data.get("linkedin")
+                ))
+
+            result = {
                 "success": True,
                 "domain": domain,
                 "organization": data.get("organization"),
@@ -73,13 +116,9 @@ class HunterIO:
                 "emails": emails,
                 "departments": self._extract_departments(emails)
             }
+            self._cache.set(cache_key, result)
+            return result
 
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                return {"success": False, "error": "Invalid API key"}
-            elif e.response.status_code == 429:
-                return {"success": False, "error": "Rate limit exceeded"}
-            return {"success": False, "error": str(e)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -116,13 +155,10 @@ class HunterIO:
                 params["last_name"] = last_name
 
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/email-finder",
-                params=params,
-                timeout=15
-            )
-            response.raise_for_status()
-            data = response.json().get("data", {})
+            response = _request("GET", f"{self.BASE_URL}/email-finder", params=params)
+            if not response["success"]:
+                return response
+            data = response["data"].get("data", {})
 
             return {
                 "success": True,
@@ -151,13 +187,10 @@ class HunterIO:
         }
 
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/email-verifier",
-                params=params,
-                timeout=15
-            )
-            response.raise_for_status()
-            data = response.json().get("data", {})
+            response = _request("GET", f"{self.BASE_URL}/email-verifier", params=params)
+            if not response["success"]:
+                return response
+            data = response["data"].get("data", {})
 
             return {
                 "success": True,
@@ -172,14 +205,14 @@ class HunterIO:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def _extract_departments(self, emails: List[Dict]) -> Dict:
+    def _extract_departments(self, emails: List[EmailRecord]) -> Dict:
         """Group emails by department."""
         departments = {}
         for email in emails:
-            dept = email.get("department") or "Unknown"
+            dept = email.department or "Unknown"
             if dept not in departments:
                 departments[dept] = []
-            departments[dept].append(email.get("email"))
+            departments[dept].append(email.email)
         return departments
 
 
@@ -188,6 +221,8 @@ class ApolloIO:
 
     BASE_URL = "https://api.apollo.io/v1"
 
+    _cache = TTLCache(maxsize=512, ttl=3600)
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Apollo.io client.
@@ -224,6 +259,11 @@ class ApolloIO:
                 "VP Marketing", "Director Marketing"
             ]
 
+        cache_key = ("search_contacts", domain, tuple(titles), limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         payload = {
             "api_key": self.api_key,
             "q_organization_domains": domain,
@@ -232,13 +272,10 @@ class ApolloIO:
         }
 
         try:
-            response = requests.post(
-                f"{self.BASE_URL}/mixed_people/search",
-                json=payload,
-                timeout=15
-            )
-            response.raise_for_status()
-            data = response.json()
+            response = _request("POST", f"{self.BASE_URL}/mixed_people/search", json=payload)
+            if not response["success"]:
+                return response
+            data = response["data"]
 
             contacts = []
             for person in data.get("people", []):
@@ -253,12 +290,14 @@ class ApolloIO:
                     "company": person.get("organization", {}).get("name")
                 })
 
-            return {
+            result = {
                 "success": True,
                 "domain": domain,
                 "contacts_found": len(contacts),
                 "contacts": contacts
             }
+            self._cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -276,21 +315,23 @@ class ApolloIO:
         if not self.api_key:
             return {"success": False, "error": "Apollo API key required"}
 
+        cache_key = ("enrich_company", domain)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         payload = {
             "api_key": self.api_key,
             "domain": domain
         }
 
         try:
-            response = requests.post(
-                f"{self.BASE_URL}/organizations/enrich",
-                json=payload,
-                timeout=15
-            )
-            response.raise_for_status()
-            data = response.json().get("organization", {})
+            response = _request("POST", f"{self.BASE_URL}/organizations/enrich", json=payload)
+            if not response["success"]:
+                return response
+            data = response["data"].get("organization", {})
 
-            return {
+            result = {
                 "success": True,
                 "name": data.get("name"),
                 "domain": domain,
@@ -307,6 +348,8 @@ class ApolloIO:
                 "technologies": data.get("technologies", [])[:10],
                 "keywords": data.get("keywords", [])[:10]
             }
+            self._cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -379,16 +422,16 @@ class EmailFinder:
                     result["email_pattern"] = hunter_result.get("pattern")
 
                     for email in hunter_result.get("emails", []):
-                        if email.get("type") == "generic":
-                            result["generic_emails"].append(email.get("email"))
+                        if email.type == "generic":
+                            result["generic_emails"].append(email.email)
                         else:
                             result["contacts"].append({
-                                "name": f"{email.get('first_name', '')} {email.get('last_name', '')}".strip(),
-                                "email": email.get("email"),
-                                "title": email.get("position"),
-                                "department": email.get("department"),
-                                "confidence": email.get("confidence"),
-                                "linkedin": email.get("linkedin"),
+                                "name": f"{email.first_name or ''} {email.last_name or ''}".strip(),
+                                "email": email.email,
+                                "title": email.position,
+                                "department": email.department,
+                                "confidence": email.confidence,
+                                "linkedin": email.linkedin,
                                 "source": "hunter.io"
                             })
             except Exception as e:
@@ -401,13 +444,15 @@ class EmailFinder:
                 result["sources_checked"].append("apollo.io")
 
                 if apollo_result.get("success"):
+                    # Avoid duplicates of contacts already found via Hunter
+                    seen_emails = {c["email"] for c in result["contacts"] if c.get("email")}
                     for contact in apollo_result.get("contacts", []):
-                        # Avoid duplicates
-                        existing_emails = [c.get("email") for c in result["contacts"]]
-                        if contact.get("email") and contact.get("email") not in existing_emails:
+                        email = contact.get("email")
+                        if email and email not in seen_emails:
+                            seen_emails.add(email)
                             result["contacts"].append({
                                 "name": contact.get("name"),
-                                "email": contact.get("email"),
+                                "email": email,
                                 "title": contact.get("title"),
                                 "linkedin": contact.get("linkedin_url"),
                                 "location": contact.get("country"),
@@ -427,6 +472,29 @@ class EmailFinder:
         result["total_contacts"] = len(result["contacts"])
         return result
 
+    def find_contacts_many(
+        self,
+        websites: List[str],
+        target_roles: List[str] = None,
+        max_workers: int = 8
+    ) -> List[Dict]:
+        """
+        Find business contacts for several companies concurrently.
+
+        Args:
+            websites: Company website URLs
+            target_roles: Specific roles to target
+            max_workers: Max lookups in flight at once
+
+        Returns:
+            One find_contacts result per website, in the same order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda website: self.find_contacts(website, target_roles),
+                websites
+            ))
+
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
         if not url.startswith(("http://", "https://")):
@@ -494,7 +562,7 @@ def verify_email(email: str) -> str:
 
 
 if __name__ == "__main__":
-    # Test (requires API keys)
+    # Test (requires API keys); run from the repo root with: python -m tools.email_finder
     print("Testing Email Finder...")
 
     if os.getenv("HUNTER_API_KEY"):
@@ -4,18 +4,55 @@ Uses the free openFDA API - no API key required (rate limited to 240 requests/mi
 https://open.fda.gov/apis/device/510k/
 """
 
+import atexit
 import requests
-import json
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import re
 
+from ._cache import TTLCache
+from ._http_json import parse_json, to_json
+from ._ratelimit import FDA_BUCKET, send_with_retry
+
+_MISSING = object()
+
+# One connection pool to api.fda.gov for the whole process
+_SESSION = requests.Session()
+atexit.register(_SESSION.close)
+
+# Characters that might break an openFDA search query
+_CLEAN_RE = re.compile(r'[^\w\s\-\.]')
+# Any word character; words without one are bare punctuation
+_WORD_CHAR_RE = re.compile(r"\w")
+
 
 class FDADatabase:
     """Interface to FDA openFDA device database."""
 
     BASE_URL = "https://api.fda.gov/device"
 
+    _cache = TTLCache(maxsize=2048, ttl=3600)
+    # openFDA answers 404 when nothing matches; remember that for less time
+    NOT_FOUND_TTL = 300
+
+    # Largest skip value openFDA accepts when paging
+    MAX_SKIP = 25000
+
+    # Result fields actually read from each endpoint
+    CLEARANCE_FIELDS = (
+        "k_number", "device_name", "applicant", "decision_date", "decision_code",
+        "product_code", "device_class", "review_advisory_committee",
+        "statement_or_summary", "clearance_type"
+    )
+    RECALL_FIELDS = (
+        "res_event_number", "product_description", "reason_for_recall",
+        "product_res_number", "status", "recall_initiation_date"
+    )
+    REGISTRATION_FIELDS = (
+        "establishment_type", "registration", "address_line_1", "city", "iso_country_code"
+    )
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize FDA API client.
@@ -23,7 +60,7 @@ class FDADatabase:
         Get a key at: https://open.fda.gov/apis/authentication/
         """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = _SESSION
 
     def search_510k(
         self,
@@ -44,27 +81,29 @@ class FDADatabase:
         Returns:
             Dictionary with clearance results and summary
         """
+        # Exact phrase clauses, plus word-by-word clauses as a fallback
         search_parts = []
+        loose_parts = []
 
         if company_name:
             # Search in applicant field
-            clean_name = self._clean_search_term(company_name)
-            search_parts.append(f'applicant:"{clean_name}"')
+            search_parts.append(self._field_query("applicant", company_name))
+            loose_parts.append(self._field_query("applicant", company_name, exact=False))
 
         if product_name:
-            clean_product = self._clean_search_term(product_name)
-            search_parts.append(f'device_name:"{clean_product}"')
+            search_parts.append(self._field_query("device_name", product_name))
+            loose_parts.append(self._field_query("device_name", product_name, exact=False))
 
         if device_class:
             search_parts.append(f'device_class:"{device_class}"')
+            loose_parts.append(f'device_class:"{device_class}"')
 
         if not search_parts:
             return {"error": "At least one search parameter required"}
 
-        search_query = "+AND+".join(search_parts)
-
+        # requests encodes the spaces; a literal "+" would be sent as %2B
         params = {
-            "search": search_query,
+            "search": " AND ".join(search_parts),
             "limit": limit,
             "sort": "decision_date:desc"  # Most recent first
         }
@@ -73,13 +112,14 @@ class FDADatabase:
             params["api_key"] = self.api_key
 
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/510k.json",
-                params=params,
-                timeout=15
-            )
+            data = self._cached_get("510k.json", params, fields=self.CLEARANCE_FIELDS)
 
-            if response.status_code == 404:
+            # Phrase match found nothing; retry once matching the words in any order
+            if data is None and loose_parts != search_parts:
+                params["search"] = " AND ".join(loose_parts)
+                data = self._cached_get("510k.json", params, fields=self.CLEARANCE_FIELDS)
+
+            if data is None:
                 return {
                     "found": False,
                     "total": 0,
@@ -87,23 +127,7 @@ class FDADatabase:
                     "message": "No 510(k) clearances found matching criteria"
                 }
 
-            response.raise_for_status()
-            data = response.json()
-
-            clearances = []
-            for item in data.get("results", []):
-                clearances.append({
-                    "k_number": item.get("k_number"),
-                    "device_name": item.get("device_name"),
-                    "applicant": item.get("applicant"),
-                    "decision_date": item.get("decision_date"),
-                    "decision_code": item.get("decision_code"),
-                    "product_code": item.get("product_code"),
-                    "device_class": item.get("device_class"),
-                    "review_panel": item.get("review_advisory_committee"),
-                    "statement_or_summary": item.get("statement_or_summary"),
-                    "clearance_type": item.get("clearance_type")
-                })
+            clearances = [self._format_clearance(item) for item in data.get("results", [])]
 
             return {
                 "found": True,
@@ -120,6 +144,95 @@ class FDADatabase:
         except Exception as e:
             return {"error": f"Request failed: {str(e)}"}
 
+    def search_510k_batch(self, companies: List[str], limit_per: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Search 510(k) clearances for several companies with one OR query.
+
+        Records are grouped by applicant name. Companies with no records in the
+        combined results are looked up individually, as are companies short of
+        limit_per when the combined results were cut off at the query limit
+        (prolific applicants may have crowded them out).
+
+        Args:
+            companies: Manufacturer/applicant names
+            limit_per: Max clearances to return per company
+
+        Returns:
+            Dictionary of company name to its most recent clearances
+        """
+        # Normalized as whole words so "GE" does not match "GETINGE"
+        def normalize(name: str) -> str:
+            return " " + " ".join(self._clean_search_term(name).lower().split()) + " "
+
+        names = {company: normalize(company) for company in companies}
+        grouped = {company: [] for company in companies}
+        if not companies:
+            return grouped
+
+        phrases = " OR ".join(f'"{name.strip()}"' for name in names.values())
+        params = {
+            "search": f"applicant:({phrases})",
+            "limit": min(limit_per * len(names), 1000),
+            "sort": "decision_date:desc"
+        }
+
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        try:
+            data = self._cached_get("510k.json", params, fields=self.CLEARANCE_FIELDS) or {}
+        except Exception:
+            data = {}
+
+        for item in data.get("results", []):
+            applicant = normalize(item.get("applicant") or "")
+            for company, name in names.items():
+                if name in applicant and len(grouped[company]) < limit_per:
+                    grouped[company].append(self._format_clearance(item))
+
+        # A full page means other companies' records may have been cut off
+        truncated = len(data.get("results", [])) >= params["limit"]
+
+        for company, clearances in grouped.items():
+            if not clearances or (truncated and len(clearances) < limit_per):
+                result = self.search_510k(company_name=company, limit=limit_per)
+                grouped[company] = result.get("clearances", [])
+
+        return grouped
+
+    def iter_510k(self, company_name: str, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Yield all 510(k) clearances for a company, most recent first.
+
+        Pages are fetched lazily with openFDA's skip parameter; the first page
+        reports the total, so no separate count query is needed.
+
+        Args:
+            company_name: Manufacturer/applicant name
+            page_size: Records per request (openFDA max 1000)
+        """
+        params = {
+            "search": self._field_query("applicant", company_name),
+            "limit": page_size,
+            "sort": "decision_date:desc"
+        }
+
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        skip = 0
+        total = None
+        while (total is None or skip < total) and skip <= self.MAX_SKIP:
+            params["skip"] = skip
+            data = self._cached_get("510k.json", params, fields=self.CLEARANCE_FIELDS)
+            if not data or not data.get("results"):
+                return
+
+            total = data.get("meta", {}).get("results", {}).get("total", 0)
+            for item in data["results"]:
+                yield self._format_clearance(item)
+            skip += page_size
+
     def get_510k_details(self, k_number: str) -> Dict:
         """Get detailed information for a specific 510(k) number."""
         params = {
@@ -131,15 +244,9 @@ class FDADatabase:
             params["api_key"] = self.api_key
 
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/510k.json",
-                params=params,
-                timeout=15
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("results"):
+            data = self._cached_get("510k.json", params)
+
+            if data and data.get("results"):
                 return {"found": True, "details": data["results"][0]}
             return {"found": False, "message": f"No clearance found for {k_number}"}
 
@@ -160,18 +267,11 @@ class FDADatabase:
             params["api_key"] = self.api_key
 
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/recall.json",
-                params=params,
-                timeout=15
-            )
+            data = self._cached_get("recall.json", params, fields=self.RECALL_FIELDS)
 
-            if response.status_code == 404:
+            if data is None:
                 return {"found": False, "recalls": [], "message": "No recalls found"}
 
-            response.raise_for_status()
-            data = response.json()
-
             recalls = []
             for item in data.get("results", []):
                 recalls.append({
@@ -205,18 +305,11 @@ class FDADatabase:
             params["api_key"] = self.api_key
 
         try:
-            response = self.session.get(
-                f"{self.BASE_URL}/registrationlisting.json",
-                params=params,
-                timeout=15
-            )
+            data = self._cached_get("registrationlisting.json", params, fields=self.REGISTRATION_FIELDS)
 
-            if response.status_code == 404:
+            if data is None:
                 return {"registered": False, "establishments": []}
 
-            response.raise_for_status()
-            data = response.json()
-
             establishments = []
             for item in data.get("results", []):
                 establishments.append({
@@ -254,15 +347,21 @@ class FDADatabase:
             "risk_notes": []
         }
 
+        # The three lookups are independent, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            clearances_future = executor.submit(self.search_510k, company_name=company_name, limit=10)
+            recalls_future = executor.submit(self.search_recalls, company_name, limit=5)
+            registrations_future = executor.submit(self.search_registrations, company_name)
+
         # Get 510(k) clearances
-        clearances = self.search_510k(company_name=company_name, limit=10)
+        clearances = clearances_future.result()
         if clearances.get("found"):
             profile["fda_cleared"] = True
             profile["clearance_count"] = clearances.get("total", 0)
             profile["recent_clearances"] = clearances.get("clearances", [])[:5]
 
         # Get recalls
-        recalls = self.search_recalls(company_name, limit=5)
+        recalls = recalls_future.result()
         if recalls.get("found") and recalls.get("recalls"):
             profile["has_recalls"] = True
             profile["recall_count"] = recalls.get("total", 0)
@@ -270,23 +369,92 @@ class FDADatabase:
             profile["risk_notes"].append(f"Company has {recalls.get('total', 0)} recall(s) on record")
 
         # Get registrations
-        registrations = self.search_registrations(company_name)
+        registrations = registrations_future.result()
         if registrations.get("registered"):
             profile["fda_registered"] = True
 
         return profile
 
+    def _format_clearance(self, item: Dict) -> Dict:
+        """Map a raw 510(k) record to the clearance fields we report."""
+        return {
+            "k_number": item.get("k_number"),
+            "device_name": item.get("device_name"),
+            "applicant": item.get("applicant"),
+            "decision_date": item.get("decision_date"),
+            "decision_code": item.get("decision_code"),
+            "product_code": item.get("product_code"),
+            "device_class": item.get("device_class"),
+            "review_panel": item.get("review_advisory_committee"),
+            "statement_or_summary": item.get("statement_or_summary"),
+            "clearance_type": item.get("clearance_type")
+        }
+
+    def _cached_get(
+        self,
+        endpoint: str,
+        params: Dict,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[Dict]:
+        """
+        GET an openFDA endpoint, caching responses by endpoint and params.
+
+        openFDA has no server-side field selection, so when fields is given
+        each result is trimmed to those keys before it is cached.
+
+        Returns:
+            Parsed JSON, or None if openFDA reports no matching records (404)
+        """
+        key = (endpoint, frozenset(params.items()), fields)
+        cached = self._cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        response = send_with_retry(FDA_BUCKET, lambda: self.session.get(
+            f"{self.BASE_URL}/{endpoint}",
+            params=params,
+            timeout=15
+        ))
+
+        if response.status_code == 404:
+            self._cache.set(key, None, ttl=self.NOT_FOUND_TTL)
+            return None
+
+        response.raise_for_status()
+        data = parse_json(response)
+        if fields is not None:
+            data["results"] = [
+                {field: item[field] for field in fields if field in item}
+                for item in data.get("results", [])
+            ]
+        self._cache.set(key, data)
+        return data
+
+    def _field_query(self, field: str, term: str, exact: bool = True) -> str:
+        """
+        Build an openFDA search clause for a field.
+        Exact queries match the cleaned term as a phrase; loose ones require each word.
+        Words are quoted so tokens like "AND" or "-" are not read as query syntax.
+        """
+        words = self._clean_search_term(term).split()
+        if exact:
+            return f'{field}:"{" ".join(words)}"'
+
+        # Bare punctuation ("Getinge - Maquet") is not searchable on its own
+        words = [word for word in words if _WORD_CHAR_RE.search(word)]
+        if len(words) < 2:
+            return f'{field}:"{" ".join(words)}"'
+        return "(" + " AND ".join(f'{field}:"{word}"' for word in words) + ")"
+
     def _clean_search_term(self, term: str) -> str:
         """Clean search term for FDA API."""
-        # Remove special characters that might break the query
-        cleaned = re.sub(r'[^\w\s\-\.]', '', term)
-        return cleaned.strip()
+        return _CLEAN_RE.sub('', term).strip()
 
 
-def check_fda_510k(company_name: str, product_name: Optional[str] = None) -> str:
+def check_fda_510k(company_name: str, product_name: Optional[str] = None, pretty: bool = False) -> str:
     """
     Main function for agent to check FDA 510(k) status.
-    Returns JSON string with clearance information.
+    Returns compact JSON string with clearance information (indented if pretty).
     """
     fda = FDADatabase()
     result = fda.search_510k(
@@ -294,29 +462,29 @@ def check_fda_510k(company_name: str, product_name: Optional[str] = None) -> str
         product_name=product_name,
         limit=15
     )
-    return json.dumps(result, indent=2, default=str)
+    return to_json(result, pretty)
 
 
-def get_fda_company_profile(company_name: str) -> str:
+def get_fda_company_profile(company_name: str, pretty: bool = False) -> str:
     """
     Get full FDA profile for a company.
-    Returns JSON with clearances, recalls, and registration status.
+    Returns compact JSON with clearances, recalls, and registration status (indented if pretty).
     """
     fda = FDADatabase()
     profile = fda.get_company_fda_profile(company_name)
-    return json.dumps(profile, indent=2, default=str)
+    return to_json(profile, pretty)
 
 
 if __name__ == "__main__":
-    # Test FDA lookups
+    # Test FDA lookups; run from the repo root with: python -m tools.fda_api
     print("Testing FDA API...")
 
     # Test 510(k) search
     print("\n--- 510(k) Search for Medtronic ---")
-    result = check_fda_510k("Medtronic")
+    result = check_fda_510k("Medtronic", pretty=True)
     print(result)
 
     # Test company profile
     print("\n--- Full FDA Profile for Philips ---")
-    profile = get_fda_company_profile("Philips")
+    profile = get_fda_company_profile("Philips", pretty=True)
     print(profile)
@@ -2,18 +2,58 @@
 Notion integration for saving research results.
 """
 
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Set
 import sys
 sys.path.append("..")
 from config import NOTION_API_KEY, NOTION_DATABASE_ID
 
+from ._cache import TTLCache
+from ._http_json import parse_json
+from ._ratelimit import NOTION_BUCKET, send_with_retry
+
+
+def _build_session() -> requests.Session:
+    """
+    Create the pooled session shared by all NotionDB instances.
+    urllib3 only retries idempotent methods on these statuses, so page
+    creation POSTs are never replayed; 429s are handled by send_with_retry.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# One connection pool to api.notion.com for the whole process
+_SESSION = _build_session()
+atexit.register(_SESSION.close)
+
 
 class NotionDB:
     """Simple Notion database client for research results."""
 
+    # Select option name -> id for each select property, per database id
+    _select_options_cache: Dict[str, Dict[str, Dict[str, str]]] = {}
+    # Monotonic time of the last failed schema fetch, per database id
+    _select_options_failed_at: Dict[str, float] = {}
+    # Seconds to wait before fetching the schema again after a failure
+    SCHEMA_RETRY_AFTER = 300
+    # Lowercased company names, per database id; reloaded after the TTL so
+    # rows added elsewhere are picked up
+    _existing_names_cache = TTLCache(maxsize=16, ttl=600)
+
     def __init__(self):
         self.api_key = NOTION_API_KEY
         self.database_id = NOTION_DATABASE_ID
@@ -23,6 +63,7 @@ class NotionDB:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28"
         }
+        self.session = _SESSION
 
     def save_company(self, company_data: Dict[str, Any]) -> str:
         """
@@ -44,13 +85,15 @@ class NotionDB:
             "notes": "Research notes here"
         }
         """
+        # Resolved once per save; the four select properties share it
+        options = self._select_options()
 
         properties = {
             "Company Name": {
                 "title": [{"text": {"content": company_data.get("name", "Unknown")}}]
             },
             "Specialty": {
-                "select": {"name": company_data.get("specialty", "Other")}
+                "select": self._select(options, "Specialty", company_data.get("specialty", "Other"))
             },
             "Headquarters": {
                 "rich_text": [{"text": {"content": company_data.get("headquarters", "")}}]
@@ -71,10 +114,10 @@ class NotionDB:
                 "checkbox": company_data.get("iso_13485", False)
             },
             "Gulf Presence": {
-                "select": {"name": company_data.get("gulf_presence", "None/Unknown")}
+                "select": self._select(options, "Gulf Presence", company_data.get("gulf_presence", "None/Unknown"))
             },
             "Distribution Model": {
-                "select": {"name": company_data.get("distribution_model", "Unknown")}
+                "select": self._select(options, "Distribution Model", company_data.get("distribution_model", "Unknown"))
             },
             "Notes": {
                 "rich_text": [{"text": {"content": company_data.get("notes", "")[:2000]}}]
@@ -83,7 +126,7 @@ class NotionDB:
                 "date": {"start": datetime.now().isoformat()[:10]}
             },
             "Status": {
-                "select": {"name": "Researched"}
+                "select": self._select(options, "Status", "Researched")
             }
         }
 
@@ -97,13 +140,18 @@ class NotionDB:
         }
 
         try:
-            response = requests.post(
+            response = send_with_retry(NOTION_BUCKET, lambda: self.session.post(
                 f"{self.base_url}/pages",
                 headers=self.headers,
                 json=payload
-            )
+            ))
             response.raise_for_status()
-            result = response.json()
+            result = parse_json(response)
+
+            existing_names = self._existing_names_cache.get(self.database_id)
+            if existing_names is not None:
+                existing_names.add(company_data.get("name", "Unknown").strip().lower())
+
             return json.dumps({
                 "success": True,
                 "page_id": result.get("id"),
@@ -117,24 +165,95 @@ class NotionDB:
                 "response": e.response.text if e.response else None
             })
 
-    def query_existing(self, company_name: str) -> bool:
-        """Check if a company already exists in the database."""
-        payload = {
-            "filter": {
-                "property": "Company Name",
-                "title": {"contains": company_name}
-            }
-        }
+    def _select_options(self) -> Dict[str, Dict[str, str]]:
+        """
+        Map each select property to its {option name: option id}.
+        The schema is fetched once per database and shared across instances.
+        """
+        options = self._select_options_cache.get(self.database_id)
+        if options is not None:
+            return options
+
+        # A recent failure (e.g. no read access) is not retried on every save
+        failed_at = self._select_options_failed_at.get(self.database_id)
+        if failed_at is not None and time.monotonic() - failed_at < self.SCHEMA_RETRY_AFTER:
+            return {}
 
         try:
-            response = requests.post(
+            response = send_with_retry(NOTION_BUCKET, lambda: self.session.get(
+                f"{self.base_url}/databases/{self.database_id}",
+                headers=self.headers
+            ))
+            response.raise_for_status()
+            properties = parse_json(response).get("properties", {})
+        except Exception:
+            # Fall back to sending option names; retry after SCHEMA_RETRY_AFTER
+            self._select_options_failed_at[self.database_id] = time.monotonic()
+            return {}
+
+        options = {
+            prop: {opt["name"]: opt["id"] for opt in schema["select"].get("options", [])}
+            for prop, schema in properties.items()
+            if schema.get("type") == "select"
+        }
+        self._select_options_cache[self.database_id] = options
+        return options
+
+    def _select(self, options: Dict[str, Dict[str, str]], prop: str, name: str) -> Dict[str, str]:
+        """Select value for a property, by option id when the option already exists."""
+        option_id = options.get(prop, {}).get(name)
+        return {"id": option_id} if option_id else {"name": name}
+
+    def save_companies_batch(self, rows: List[Dict[str, Any]], max_workers: int = 3) -> List[str]:
+        """
+        Save several companies concurrently.
+
+        Requests still pass through the shared Notion rate limiter, so this
+        overlaps round trips without exceeding 3 requests/second.
+
+        Returns:
+            One save_company result per row, in the same order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.save_company, rows))
+
+    def preload_existing_names(self) -> Set[str]:
+        """
+        Fetch every company name in the database, 100 pages per query.
+        Names are lowercased and cached for query_existing.
+        """
+        names = set()
+        payload = {"page_size": 100}
+
+        while True:
+            response = send_with_retry(NOTION_BUCKET, lambda: self.session.post(
                 f"{self.base_url}/databases/{self.database_id}/query",
                 headers=self.headers,
                 json=payload
-            )
+            ))
             response.raise_for_status()
-            results = response.json().get("results", [])
-            return len(results) > 0
+            data = parse_json(response)
+
+            for page in data.get("results", []):
+                title = page.get("properties", {}).get("Company Name", {}).get("title", [])
+                name = "".join(part.get("plain_text", "") for part in title)
+                if name:
+                    names.add(name.strip().lower())
+
+            if not data.get("has_more"):
+                break
+            payload = {"page_size": 100, "start_cursor": data.get("next_cursor")}
+
+        self._existing_names_cache.set(self.database_id, names)
+        return names
+
+    def query_existing(self, company_name: str) -> bool:
+        """Check if a company already exists in the database."""
+        try:
+            existing_names = self._existing_names_cache.get(self.database_id)
+            if existing_names is None:
+                existing_names = self.preload_existing_names()
+            return company_name.strip().lower() in existing_names
 
         except Exception:
             return False
@@ -147,7 +266,7 @@ def save_to_notion_db(company_data: Dict) -> str:
 
 
 if __name__ == "__main__":
-    # Test with sample data
+    # Test with sample data; run from the repo root with: python -m tools.notion_client
     test_company = {
         "name": "Test Medical Co",
         "specialty": "PICU Equipment",
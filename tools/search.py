@@ -3,50 +3,91 @@ DuckDuckGo HTML Search Scraper - No API key required.
 Uses DuckDuckGo's HTML interface which is more permissive than Google.
 """
 
-import json
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
-import time
-import random
-from urllib.parse import quote_plus
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlparse, urlunparse
+
+from ._http_json import to_json
+from ._ratelimit import HOST_BUCKETS
+
+
+def _build_session(headers: Dict[str, str]) -> requests.Session:
+    """Create a pooled session that retries transient 5xx and network errors."""
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods={"GET", "POST"}
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+def _parse_stream(response: requests.Response, strainer: SoupStrainer) -> BeautifulSoup:
+    """
+    Check the status of a streamed response and parse its raw body.
+    BeautifulSoup reads the whole body into memory before parsing, but lxml
+    decodes the bytes itself, so response.text is never built.
+    The response is closed either way, releasing its pooled connection.
+    """
+    try:
+        response.raise_for_status()
+        response.raw.decode_content = True  # undo gzip/deflate transfer encoding
+        return BeautifulSoup(response.raw, "lxml", parse_only=strainer, from_encoding=response.encoding)
+    finally:
+        response.close()
 
 
 class DuckDuckGoScraper:
     """Scrapes DuckDuckGo HTML search results."""
 
+    # Only result cards are built into the parse tree. The strainer sees the
+    # raw class attribute ("result results_links web-result"), so match the token.
+    RESULT_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)result(?:\s|$)"))
+
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _build_session({
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Referer": "https://duckduckgo.com/",
+        })
         self.base_url = "https://html.duckduckgo.com/html/"
 
     def search(self, query: str, num_results: int = 10) -> List[Dict]:
         """Search DuckDuckGo and return results."""
         results = []
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Referer": "https://duckduckgo.com/",
-        }
-
         try:
             # DuckDuckGo HTML uses POST
+            HOST_BUCKETS["html.duckduckgo.com"].acquire()
             response = self.session.post(
                 self.base_url,
                 data={"q": query, "b": ""},
-                headers=headers,
-                timeout=15
+                timeout=15,
+                stream=True
             )
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = _parse_stream(response, self.RESULT_STRAINER)
 
             # Find result links
-            for result in soup.find_all("div", class_="result"):
+            for result in soup.find_all("div", class_="result", limit=num_results):
                 try:
+                    # Title and snippet links collected in one walk of the card
+                    title_elem = desc_elem = None
+                    for link in result.find_all("a", class_=("result__a", "result__snippet"), limit=2):
+                        if "result__a" in link.get("class", []):
+                            title_elem = title_elem or link
+                        else:
+                            desc_elem = desc_elem or link
+
                     # Get title and URL
-                    title_elem = result.find("a", class_="result__a")
                     if not title_elem:
                         continue
 
@@ -58,7 +99,6 @@ class DuckDuckGoScraper:
                         continue
 
                     # Get description
-                    desc_elem = result.find("a", class_="result__snippet")
                     desc = desc_elem.get_text(strip=True) if desc_elem else ""
 
                     results.append({
@@ -82,26 +122,27 @@ class DuckDuckGoScraper:
 class BingHTMLScraper:
     """Fallback: Scrapes Bing HTML search results."""
 
+    # Only organic result items are built into the parse tree; matched as a
+    # class token since some items carry extra classes
+    RESULT_STRAINER = SoupStrainer("li", class_=re.compile(r"(?:^|\s)b_algo(?:\s|$)"))
+
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _build_session({
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        })
 
     def search(self, query: str, num_results: int = 10) -> List[Dict]:
         """Search Bing and return results."""
         results = []
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
-
         try:
             url = f"https://www.bing.com/search?q={quote_plus(query)}&count={num_results}"
-            response = self.session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
+            HOST_BUCKETS["www.bing.com"].acquire()
+            response = self.session.get(url, timeout=15, stream=True)
+            soup = _parse_stream(response, self.RESULT_STRAINER)
 
-            for li in soup.find_all("li", class_="b_algo"):
+            for li in soup.find_all("li", class_="b_algo", limit=num_results):
                 try:
                     a = li.find("a", href=True)
                     if not a:
@@ -131,26 +172,49 @@ class BingHTMLScraper:
         return results[:num_results]
 
 
+# Shared so connections are reused across queries
+_ddg = DuckDuckGoScraper()
+_bing = BingHTMLScraper()
+
+
 def web_search(query: str, max_results: int = 10) -> List[Dict]:
     """
     Search using DuckDuckGo (fallback to Bing).
     No API key needed.
     """
     # Try DuckDuckGo first
-    ddg = DuckDuckGoScraper()
-    results = ddg.search(query, max_results)
+    results = _ddg.search(query, max_results)
 
     # Fallback to Bing if DuckDuckGo fails
     if not results:
         print("  DuckDuckGo failed, trying Bing...")
-        bing = BingHTMLScraper()
-        results = bing.search(query, max_results)
+        results = _bing.search(query, max_results)
 
     return results
 
 
-def search_manufacturers(specialty: str) -> str:
-    """Search for manufacturers in a medical specialty."""
+# Query parameters that only track the click, not the page
+_TRACKING_PARAMS = {"ref", "fbclid", "gclid"}
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize a URL for deduplication.
+    Ignores scheme, host case, trailing slash, fragment and tracking params.
+    """
+    parsed = urlparse(url)
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+    ])
+    return urlunparse(("", parsed.netloc.lower(), parsed.path.rstrip("/"), "", query, ""))
+
+
+def search_manufacturers(specialty: str, pretty: bool = False) -> str:
+    """
+    Search for manufacturers in a medical specialty.
+    Returns compact JSON (indented if pretty).
+    """
     queries = [
         f"{specialty} equipment manufacturers",
         f"{specialty} medical devices companies",
@@ -162,21 +226,29 @@ def search_manufacturers(specialty: str) -> str:
 
     for query in queries:
         print(f"  Searching: {query}...")
-        results = web_search(query, max_results=10)
+
+    # Run the queries concurrently; results are merged in query order
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        query_results = list(executor.map(lambda q: web_search(q, max_results=10), queries))
+
+    for results in query_results:
         for r in results:
             url = r.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
+            if not url:
+                continue
+            key = _canonical_url(url)
+            if key not in seen_urls:
+                seen_urls.add(key)
                 all_results.append(r)
-        time.sleep(random.uniform(0.5, 1))
 
-    return json.dumps(all_results, indent=2)
+    return to_json(all_results, pretty)
 
 
 brave_search = web_search
 
 
 if __name__ == "__main__":
+    # Run from the repo root with: python -m tools.search
     print("Testing DuckDuckGo/Bing scraper...")
     results = web_search("PICU equipment manufacturers medical", max_results=5)
     print(f"Found {len(results)} results:")
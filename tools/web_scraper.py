@@ -4,25 +4,172 @@ Extracts structured information from manufacturer websites.
 """
 
 import requests
+from datetime import timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+import lxml.html
+from lxml import etree
+import soupsieve
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urljoin, urlparse
 import json
 import re
-from typing import Dict, List, Optional
+import sqlite3
+from typing import Callable, Dict, List, NamedTuple, Optional
 import time
 
+from ._page_cache import PageCache
+
+
+# Certification mentions and the name reported for each, in report order.
+# Patterns are matched against lowercased page text, and only need to find a
+# mention, so optional trailing words ("CE marked", "GMP certified") are left out.
+_CERT_PATTERNS = [
+    (r"ce\s*mark", "CE Mark"),
+    (r"fda\s*(?:510\(?k\)?|cleared|approved|registered)", "FDA"),
+    (r"iso\s*13485", "ISO 13485"),
+    (r"iso\s*9001", "ISO 9001"),
+    (r"iso\s*14001", "ISO 14001"),
+    (r"mdr", "EU MDR"),
+    (r"gmp", "GMP"),
+    (r"mdsap", "MDSAP"),
+    (r"tga", "TGA (Australia)"),
+    (r"health\s*canada", "Health Canada"),
+]
+
+# Plain-literal patterns are checked with a substring search, which is much
+# faster than the regex engine
+_CERT_LITERALS = [(pattern, name) for pattern, name in _CERT_PATTERNS if re.escape(pattern) == pattern]
+
+# The rest are fused into one alternation so the page is scanned once;
+# the named group that matched identifies the certification
+_CERT_REGEX_PATTERNS = [(pattern, name) for pattern, name in _CERT_PATTERNS if re.escape(pattern) != pattern]
+_CERT_RE = re.compile("|".join(f"(?P<cert{i}>{pattern})" for i, (pattern, _) in enumerate(_CERT_REGEX_PATTERNS)))
+_CERT_NAMES = {f"cert{i}": name for i, (_, name) in enumerate(_CERT_REGEX_PATTERNS)}
+
+# "headquartered in X", "based in X", "offices in X"
+_LOCATION_RE = re.compile(r"(?:headquartered?|based|offices?)\s+in\s+(?P<loc>[A-Z][a-z]+(?:,?\s+[A-Z][a-z]+)*)")
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+_PHONE_RE = re.compile(r"[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}")
+# Runs of phone characters long enough to hold a kept (9+ char) phone match.
+# _PHONE_RE only runs inside these, so its backtracking never sees ordinary text.
+_PHONE_HINT_RE = re.compile(r"[\d+(][\d\s().+\-]{8,}")
+_ADDRESS_CLASS_RE = re.compile(r"address")
+
+# Distribution model phrases, in order of precedence
+_DISTRIBUTION_MODELS = [
+    ("Seeking Partners", ["become a partner", "become a distributor", "seeking distributors", "looking for partners"]),
+    ("Uses Distributors", ["our distributors", "authorized distributors", "find a distributor"]),
+    ("Direct Sales", ["direct sales", "buy direct", "contact sales"]),
+]
+# One alternation per model, joined with named groups so the text is scanned once.
+# Matched against lowercased text, which is cheaper than case-insensitive matching.
+_DISTRIBUTION_RE = re.compile(
+    "|".join(
+        f"(?P<model{i}>{'|'.join(re.escape(kw) for kw in kws)})"
+        for i, (_, kws) in enumerate(_DISTRIBUTION_MODELS)
+    )
+)
+
+_GULF_COUNTRIES = ["UAE", "Saudi Arabia", "Kuwait", "Qatar", "Bahrain", "Oman", "United Arab Emirates"]
+# Lowercase name -> reported name; the pattern is matched against lowercased text
+_GULF_CANONICAL = {country.lower(): country for country in _GULF_COUNTRIES}
+_GULF_RE = re.compile("|".join(re.escape(country) for country in _GULF_CANONICAL))
+_CONTENT_CLASS_RE = re.compile(r"content|main|about")
+
+
+class _Page(NamedTuple):
+    """A fetched HTML page, with its body capped at CompanyScraper.MAX_PAGE_BYTES."""
+    url: str
+    content: bytes
+    text: str
+
+    @classmethod
+    def decode(cls, url: str, content: bytes, encoding: str) -> "_Page":
+        """Build a page from its body bytes and charset."""
+        return cls(url, content, content.decode(encoding, errors="replace"))
+
+
+def _element_text(element: etree._Element, limit: int) -> str:
+    """
+    First limit chars of an element's text, joined like BeautifulSoup's get_text(" ", strip=True).
+    Stops walking the tree once enough text is collected.
+    """
+    chunks = []
+    size = -1  # no separator before the first chunk
+    for s in element.itertext():
+        chunk = s.strip()
+        if chunk:
+            chunks.append(chunk)
+            size += len(chunk) + 1
+            if size >= limit:
+                break
+    return " ".join(chunks)[:limit]
+
 
 class CompanyScraper:
     """Scrapes manufacturer websites for detailed company information."""
 
+    # Common product title patterns, matched together in one document-order pass
+    PRODUCT_SELECTORS = "h2, h3, .product-title, .product-name, [class*='product'] h2, [class*='product'] h3"
+    # Compiled once instead of on every soup.select call
+    _PRODUCT_MATCHER = soupsieve.compile(PRODUCT_SELECTORS)
+
+    # Link href/text keywords for each key page type
+    KEY_PAGE_KEYWORDS = {
+        "about": ["about", "about-us", "company", "who-we-are", "our-story"],
+        "products": ["products", "solutions", "devices", "equipment", "portfolio"],
+        "contact": ["contact", "contact-us", "get-in-touch", "reach-us"],
+        "distributors": ["distributors", "distribution", "partners", "where-to-buy", "find-distributor", "international"],
+        "partners": ["become-partner", "partnership", "dealer"]
+    }
+
+    # WordPress page slugs tried for the About page, most likely first
+    WP_ABOUT_SLUGS = ("about", "about-us", "company")
+
+    # Only the start of a page is ever used, so larger bodies are cut off here
+    MAX_PAGE_BYTES = 512 * 1024
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5"
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
         })
+        # Enough pooled connections for every concurrent key-page fetch,
+        # and transient 429/5xx responses retried instead of failing the scrape
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.timeout = 15
+        # Max key pages fetched at once for a company
+        self.max_workers = 5
+        # C-backed parser; "html.parser" is the pure-Python fallback
+        self._parser = "lxml"
+        # Parsed pages of the current scrape, keyed by final URL
+        self._soup_cache: Dict[str, BeautifulSoup] = {}
+        # Capped page bodies kept on disk, so re-scraping a company within
+        # a week does not hit its site again
+        self.page_cache = self._open_page_cache()
+
+    @staticmethod
+    def _open_page_cache() -> Optional[PageCache]:
+        """Open the on-disk page cache, or None (no caching) if it can't be opened."""
+        try:
+            return PageCache("company_scraper_cache.sqlite", ttl=timedelta(days=7).total_seconds())
+        except sqlite3.Error:
+            return None
 
     def scrape_company(self, url: str) -> Dict:
         """
@@ -51,43 +198,68 @@ class CompanyScraper:
             "error": None
         }
 
+        self._soup_cache = {}
+
         try:
             # Get homepage
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract company name
-            result["company_name"] = self._extract_company_name(soup, url)
-
-            # Extract meta description
-            result["description"] = self._extract_description(soup)
+            homepage = self._get_page(url)
+            if homepage is None:
+                result["error"] = "Not an HTML page"
+                return result
+            soup = self._get_soup(homepage)
 
             # Find and scrape key pages
             links = self._find_key_pages(soup, url)
+            dist_url = links.get("distributors") or links.get("partners")
+
+            # Sites on a known CMS serve the About page from an API instead;
+            # the About HTML is only fetched if the API has nothing
+            about_handler = self._CMS_ABOUT_HANDLERS.get(self._detect_cms(soup))
+            about_url = None if about_handler else links.get("about")
+
+            # Page types often share a URL (one-page sites, about == company),
+            # so each unique URL is fetched once, concurrently, and shared
+            pages = {url: homepage}
+            pending = list(dict.fromkeys(
+                page_url for page_url in (about_url, links.get("products"), links.get("contact"), dist_url)
+                if page_url and page_url not in pages
+            ))
+            about_data = None
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                fetches = {page_url: executor.submit(self._fetch, page_url) for page_url in pending}
+                if about_handler:
+                    about_future = executor.submit(self._scrape_cms_about, about_handler, url, links.get("about"))
+
+                # Homepage-only work runs while the key pages download
+                result["company_name"] = self._extract_company_name(soup, url)
+                result["description"] = self._extract_description(soup)
+                result["certifications"] = self._find_certifications(homepage.text)
+
+                for page_url, future in fetches.items():
+                    pages[page_url] = future.result()
+                if about_handler:
+                    about_data = about_future.result()
+
+            if pages.get(about_url) is not None:
+                about_data = self._scrape_about_page(pages[about_url])
 
             # Scrape About page
-            if links.get("about"):
-                about_data = self._scrape_about_page(links["about"])
+            if about_data is not None:
                 result["raw_about"] = about_data.get("content")
                 result["locations"].extend(about_data.get("locations", []))
 
             # Scrape Products page
-            if links.get("products"):
-                result["products"] = self._scrape_products_page(links["products"])
+            if pages.get(links.get("products")) is not None:
+                result["products"] = self._scrape_products_page(pages[links["products"]])
 
             # Scrape Contact page
-            if links.get("contact"):
-                result["contact"] = self._scrape_contact_page(links["contact"])
-
-            # Look for certifications across pages
-            result["certifications"] = self._find_certifications(soup, response.text)
+            if pages.get(links.get("contact")) is not None:
+                result["contact"] = self._scrape_contact_page(pages[links["contact"]])
 
             # Look for distribution/partner info
-            if links.get("distributors") or links.get("partners"):
-                dist_url = links.get("distributors") or links.get("partners")
-                result["distribution_info"] = self._scrape_distribution_page(dist_url)
-                result["international_presence"] = self._find_international_presence(dist_url)
+            if pages.get(dist_url) is not None:
+                result["distribution_info"] = self._scrape_distribution_page(pages[dist_url])
+                result["international_presence"] = self._find_international_presence(pages[dist_url])
 
             result["success"] = True
 
@@ -100,6 +272,110 @@ class CompanyScraper:
 
         return result
 
+    def _get_page(self, url: str, expect: str = "html") -> Optional[_Page]:
+        """
+        Fetch a page, reading at most MAX_PAGE_BYTES of its body.
+        Returns None without downloading the body if its Content-Type does not
+        contain expect ("html" for web pages, "json" for CMS APIs).
+        The capped body is cached on disk; a stale copy is served if the site is down.
+        """
+        cached = self.page_cache.get(url) if self.page_cache else None
+        if cached is not None:
+            return _Page.decode(cached.url, cached.content, cached.encoding)
+
+        try:
+            response = self.session.get(url, timeout=self.timeout, stream=True)
+        except requests.exceptions.RequestException:
+            stale = self.page_cache.get(url, allow_stale=True) if self.page_cache else None
+            if stale is None:
+                raise
+            return _Page.decode(stale.url, stale.content, stale.encoding)
+
+        try:
+            response.raise_for_status()
+            if expect not in response.headers.get("Content-Type", expect):
+                return None
+            chunks, size = [], 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= self.MAX_PAGE_BYTES:
+                    break
+            content = b"".join(chunks)[:self.MAX_PAGE_BYTES]
+        finally:
+            # Also drops whatever is left of an oversized body
+            response.close()
+
+        encoding = response.encoding or "utf-8"
+        if self.page_cache:
+            self.page_cache.set(url, response.url, content, encoding)
+        return _Page.decode(response.url, content, encoding)
+
+    def _fetch(self, url: str) -> Optional[_Page]:
+        """Fetch a key page, or None if it is missing, not HTML or the request fails."""
+        try:
+            return self._get_page(url)
+        except Exception:
+            return None
+
+    def _get_soup(self, page: _Page) -> BeautifulSoup:
+        """
+        Parse a page once per scrape and share the tree.
+        Callers must not modify it; parse a private lxml tree to strip tags.
+        """
+        soup = self._soup_cache.get(page.url)
+        if soup is None:
+            soup = self._soup_cache[page.url] = BeautifulSoup(page.content, self._parser)
+        return soup
+
+    def _detect_cms(self, soup: BeautifulSoup) -> Optional[str]:
+        """Lowercase CMS name from <meta name="generator">, e.g. "wordpress"."""
+        meta = soup.find("meta", attrs={"name": "generator"})
+        words = meta.get("content", "").split() if meta else []
+        return words[0].lower() if words else None
+
+    def _scrape_cms_about(self, handler: Callable, base_url: str, about_url: Optional[str]) -> Optional[Dict]:
+        """About page data from a CMS handler, falling back to the About page HTML."""
+        about_data = handler(self, base_url)
+        if about_data is None and about_url:
+            page = self._fetch(about_url)
+            if page is not None:
+                about_data = self._scrape_about_page(page)
+        return about_data
+
+    def _scrape_wordpress_about(self, base_url: str) -> Optional[Dict]:
+        """
+        Read the About page through the WordPress REST API instead of its HTML.
+        Returns None if the API is disabled or has no such page.
+        """
+        query = urlencode({"slug": ",".join(self.WP_ABOUT_SLUGS), "_fields": "slug,content"})
+        try:
+            page = self._get_page(urljoin(base_url, f"/wp-json/wp/v2/pages?{query}"), expect="json")
+            if page is None:
+                return None
+
+            # WordPress returns matches newest first, so pick by slug preference
+            by_slug = {wp_page.get("slug"): wp_page for wp_page in json.loads(page.content)}
+            wp_page = next((by_slug[slug] for slug in self.WP_ABOUT_SLUGS if slug in by_slug), None)
+            html = wp_page["content"]["rendered"] if wp_page else ""
+            if not html.strip():
+                return None
+
+            # The rendered body has no site navigation to strip
+            content = _element_text(lxml.html.fromstring(html), 3000)
+            return {
+                "content": content,
+                "locations": [match.group("loc") for match in _LOCATION_RE.finditer(content)]
+            }
+
+        except Exception:
+            return None
+
+    # About page handlers for CMSs detected by _detect_cms
+    _CMS_ABOUT_HANDLERS = {
+        "wordpress": _scrape_wordpress_about,
+    }
+
     def _extract_company_name(self, soup: BeautifulSoup, url: str) -> str:
         """Extract company name from page."""
         # Try og:site_name
@@ -135,102 +411,108 @@ class CompanyScraper:
     def _find_key_pages(self, soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
         """Find URLs for key pages (About, Products, Contact, Distributors)."""
         pages = {}
-        keywords = {
-            "about": ["about", "about-us", "company", "who-we-are", "our-story"],
-            "products": ["products", "solutions", "devices", "equipment", "portfolio"],
-            "contact": ["contact", "contact-us", "get-in-touch", "reach-us"],
-            "distributors": ["distributors", "distribution", "partners", "where-to-buy", "find-distributor", "international"],
-            "partners": ["become-partner", "partnership", "dealer"]
-        }
+        base_netloc = urlparse(base_url).netloc
 
         for link in soup.find_all("a", href=True):
-            href = link.get("href", "").lower()
+            href = link["href"].lower()
             text = link.text.lower().strip()
-
-            for page_type, kws in keywords.items():
-                if page_type not in pages:
-                    for kw in kws:
-                        if kw in href or kw in text:
-                            full_url = urljoin(base_url, link["href"])
-                            if urlparse(full_url).netloc == urlparse(base_url).netloc:
-                                pages[page_type] = full_url
-                                break
+            full_url = None
+
+            for page_type, kws in self.KEY_PAGE_KEYWORDS.items():
+                if page_type in pages or not any(kw in href or kw in text for kw in kws):
+                    continue
+                if full_url is None:
+                    full_url = urljoin(base_url, link["href"])
+                    if urlparse(full_url).netloc != base_netloc:
+                        # Off-site links can't be a key page of any type
+                        break
+                pages[page_type] = full_url
+
+            # Nav links usually come first, so stop once every type is found
+            if len(pages) == len(self.KEY_PAGE_KEYWORDS):
+                break
 
         return pages
 
-    def _scrape_about_page(self, url: str) -> Dict:
+    def _scrape_about_page(self, page: _Page) -> Dict:
         """Scrape About page for company info."""
         result = {"content": "", "locations": []}
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Remove nav, footer, scripts
-            for tag in soup.find_all(["nav", "footer", "script", "style", "header"]):
-                tag.decompose()
-
-            # Get main content
-            main = soup.find("main") or soup.find("article") or soup.find(class_=re.compile(r"content|main|about"))
-            if main:
-                result["content"] = main.get_text(separator=" ", strip=True)[:3000]
-            else:
-                result["content"] = soup.body.get_text(separator=" ", strip=True)[:3000] if soup.body else ""
+            # Private tree, since tags are stripped from it
+            tree = lxml.html.fromstring(page.content)
+
+            # Remove nav, footer, scripts (and comments) in one pass
+            etree.strip_elements(
+                tree, "nav", "footer", "script", "style", "header", etree.Comment, with_tail=False
+            )
+
+            # Get main content, falling back to the whole body
+            main = tree.find(".//main")
+            if main is None:
+                main = tree.find(".//article")
+            if main is None:
+                main = next(
+                    (el for el in tree.iter(etree.Element) if _CONTENT_CLASS_RE.search(el.get("class", ""))),
+                    None
+                )
+            if main is None:
+                main = tree.find(".//body")
+            result["content"] = _element_text(main, 3000) if main is not None else ""
 
             # Look for location mentions
-            location_patterns = [
-                r"headquartered?\s+in\s+([A-Z][a-z]+(?:,?\s+[A-Z][a-z]+)*)",
-                r"based\s+in\s+([A-Z][a-z]+(?:,?\s+[A-Z][a-z]+)*)",
-                r"offices?\s+in\s+([A-Z][a-z]+(?:,?\s+[A-Z][a-z]+)*)"
-            ]
-            for pattern in location_patterns:
-                matches = re.findall(pattern, result["content"])
-                result["locations"].extend(matches)
+            result["locations"].extend(match.group("loc") for match in _LOCATION_RE.finditer(result["content"]))
 
         except Exception:
             pass
 
         return result
 
-    def _scrape_products_page(self, url: str) -> List[str]:
+    def _scrape_products_page(self, page: _Page) -> List[str]:
         """Scrape Products page for product names."""
         products = []
+        seen = set()
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = self._get_soup(page)
 
             # Look for product titles in common patterns
-            for selector in ["h2", "h3", ".product-title", ".product-name", "[class*='product'] h2", "[class*='product'] h3"]:
-                for el in soup.select(selector)[:20]:
-                    text = el.get_text(strip=True)
-                    if text and len(text) < 100 and text not in products:
-                        products.append(text)
+            for el in self._PRODUCT_MATCHER.iselect(soup):
+                text = el.get_text(strip=True)
+                if text and len(text) < 100 and text not in seen:
+                    seen.add(text)
+                    products.append(text)
+                    if len(products) >= 15:
+                        break
 
         except Exception:
             pass
 
         return products[:15]  # Limit to top 15
 
-    def _scrape_contact_page(self, url: str) -> Dict:
+    def _scrape_contact_page(self, page: _Page) -> Dict:
         """Scrape Contact page for contact details."""
         contact = {"emails": [], "phones": [], "address": None}
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            text = response.text
+            text = page.text
 
-            # Find emails
-            emails = re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
-            contact["emails"] = list(set([e for e in emails if not e.endswith((".png", ".jpg", ".gif"))]))[:5]
+            # Find emails (skipping image names like logo@2x.png)
+            if "@" in text:
+                emails = _EMAIL_RE.findall(text)
+                contact["emails"] = list(dict.fromkeys(e for e in emails if not e.endswith((".png", ".jpg", ".gif"))))[:5]
 
             # Find phone numbers
-            phones = re.findall(r"[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}", text)
-            contact["phones"] = list(set([p.strip() for p in phones if len(p) > 8]))[:5]
+            phones = [
+                phone
+                for hint in _PHONE_HINT_RE.finditer(text)
+                for phone in _PHONE_RE.findall(hint.group())
+            ]
+            contact["phones"] = list(dict.fromkeys(p.strip() for p in phones if len(p) > 8))[:5]
 
             # Try to find address
-            soup = BeautifulSoup(text, "html.parser")
-            address_el = soup.find(class_=re.compile(r"address")) or soup.find("address")
+            soup = self._get_soup(page)
+            address_el = soup.find(class_=_ADDRESS_CLASS_RE) or soup.find("address")
             if address_el:
                 contact["address"] = address_el.get_text(separator=", ", strip=True)[:200]
 
@@ -239,67 +521,49 @@ class CompanyScraper:
 
         return contact
 
-    def _find_certifications(self, soup: BeautifulSoup, html: str) -> List[str]:
+    def _find_certifications(self, html: str) -> List[str]:
         """Find certification mentions in page content."""
-        certifications = []
-
-        cert_patterns = [
-            (r"CE\s*[Mm]ark(?:ed)?", "CE Mark"),
-            (r"FDA\s*(?:510\(?k\)?|cleared|approved|registered)", "FDA"),
-            (r"ISO\s*13485", "ISO 13485"),
-            (r"ISO\s*9001", "ISO 9001"),
-            (r"ISO\s*14001", "ISO 14001"),
-            (r"MDR\s*(?:compliant|certified)?", "EU MDR"),
-            (r"GMP\s*(?:certified)?", "GMP"),
-            (r"MDSAP", "MDSAP"),
-            (r"TGA\s*(?:registered|approved)?", "TGA (Australia)"),
-            (r"Health\s*Canada", "Health Canada"),
-        ]
-
-        for pattern, cert_name in cert_patterns:
-            if re.search(pattern, html, re.IGNORECASE):
-                if cert_name not in certifications:
-                    certifications.append(cert_name)
-
-        return certifications
-
-    def _scrape_distribution_page(self, url: str) -> Optional[str]:
+        html_lc = html.lower()
+        found = {cert_name for literal, cert_name in _CERT_LITERALS if literal in html_lc}
+
+        wanted = len(found) + len(_CERT_NAMES)
+        for match in _CERT_RE.finditer(html_lc):
+            found.add(_CERT_NAMES[match.lastgroup])
+            if len(found) == wanted:
+                break
+
+        return [cert_name for _, cert_name in _CERT_PATTERNS if cert_name in found]
+
+    def _scrape_distribution_page(self, page: _Page) -> Optional[str]:
         """Scrape distribution/partner page for distribution model info."""
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Private tree, since tags are stripped from it
+            tree = lxml.html.fromstring(page.content)
 
-            # Remove nav, footer
-            for tag in soup.find_all(["nav", "footer", "script", "style"]):
-                tag.decompose()
+            # Remove nav, footer, scripts (and comments) in one pass
+            etree.strip_elements(tree, "nav", "footer", "script", "style", etree.Comment, with_tail=False)
 
-            text = soup.get_text(separator=" ", strip=True)[:2000]
+            text_lc = _element_text(tree, 2000).lower()
 
-            # Analyze distribution model
-            if any(kw in text.lower() for kw in ["become a partner", "become a distributor", "seeking distributors", "looking for partners"]):
-                return "Seeking Partners"
-            elif any(kw in text.lower() for kw in ["our distributors", "authorized distributors", "find a distributor"]):
-                return "Uses Distributors"
-            elif any(kw in text.lower() for kw in ["direct sales", "buy direct", "contact sales"]):
-                return "Direct Sales"
+            # Analyze distribution model; the earliest model in the list wins
+            found = {match.lastgroup for match in _DISTRIBUTION_RE.finditer(text_lc)}
+            for i, (model, _) in enumerate(_DISTRIBUTION_MODELS):
+                if f"model{i}" in found:
+                    return model
 
         except Exception:
             pass
 
         return None
 
-    def _find_international_presence(self, url: str) -> List[str]:
+    def _find_international_presence(self, page: _Page) -> List[str]:
         """Find countries/regions where company has presence."""
         regions = []
-        gulf_countries = ["UAE", "Saudi Arabia", "Kuwait", "Qatar", "Bahrain", "Oman", "United Arab Emirates"]
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            text = response.text
-
-            for country in gulf_countries:
-                if country.lower() in text.lower():
-                    regions.append(country)
+            text_lc = page.text.lower()
+            found = {_GULF_CANONICAL[match.group()] for match in _GULF_RE.finditer(text_lc)}
+            regions = [country for country in _GULF_COUNTRIES if country in found]
 
         except Exception:
             pass
@@ -315,7 +579,7 @@ def scrape_company_website(url: str) -> str:
 
 
 if __name__ == "__main__":
-    # Test scraper
+    # Test scraper; run from the repo root with: python -m tools.web_scraper
     test_url = "https://www.medtronic.com"
     result = scrape_company_website(test_url)
     print(result)